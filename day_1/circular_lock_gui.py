@@ -1,10 +1,19 @@
 import sys
 import math
+import time
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout
+    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QSlider,
+    QCheckBox, QSpinBox
 )
-from PyQt6.QtGui import QPainter, QPen
-from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtGui import QPainter, QPen, QPixmap
+from PyQt6.QtCore import Qt, QTimer, QPoint, QRect
+
+from dial_binary import load_instructions
+from dial_index import DialIndex
+
+# Turbo mode repaints at most this often and spends at most the budget per frame on steps
+FRAME_MS = 16
+DEFAULT_BUDGET_MS = 8
 
 
 class CircularLock(QWidget):
@@ -20,9 +29,15 @@ class CircularLock(QWidget):
         self.zero_crossings = 0
         self.zero_stops_live = 0
 
+        # Precomputed positions / counters so we can jump to any instruction
+        self.index = DialIndex(instructions)
+
+        # The circle, labels and zero marker never change, so we draw them once
+        self.dial_cache = None
+
         # Animation timer
         self.timer = QTimer()
-        self.timer.timeout.connect(self.next_step)
+        self.timer.timeout.connect(self._tick)
 
         # UI buttons
         self.start_btn = QPushButton("Start")
@@ -34,26 +49,71 @@ class CircularLock(QWidget):
         self.reset_btn = QPushButton("Reset")
         self.reset_btn.clicked.connect(self.reset)
 
+        # Turbo: as many instructions per frame as fit in the budget
+        self.turbo_check = QCheckBox("Turbo")
+        self.turbo_check.toggled.connect(self._on_turbo_toggled)
+        self.budget_spin = QSpinBox()
+        self.budget_spin.setRange(1, FRAME_MS)
+        self.budget_spin.setValue(DEFAULT_BUDGET_MS)
+        self.budget_spin.setSuffix(" ms/frame")
+
         # Labels
         self.step_label = QLabel("Instruction: -")
         self.cross_label = QLabel("Zero Crossings: 0")
         self.stop_label = QLabel("Stops at 0 (Part 1): 0")
 
+        # Seek slider: 0 = before the first instruction, n = after the last one
+        self.seek_slider = QSlider(Qt.Orientation.Horizontal)
+        self.seek_slider.setRange(0, len(self.instructions))
+        self.seek_slider.valueChanged.connect(self.seek)
+
         # Layout
         h_layout = QHBoxLayout()
         h_layout.addWidget(self.start_btn)
         h_layout.addWidget(self.step_btn)
         h_layout.addWidget(self.reset_btn)
+        h_layout.addWidget(self.turbo_check)
+        h_layout.addWidget(self.budget_spin)
 
         layout = QVBoxLayout()
         layout.addWidget(self.step_label)
         layout.addWidget(self.cross_label)
         layout.addWidget(self.stop_label)
+        layout.addWidget(self.seek_slider)
         layout.addLayout(h_layout)
         self.setLayout(layout)
 
     def start(self):
-        self.timer.start(500)
+        self.timer.start(self._interval())
+
+    def _interval(self):
+        return FRAME_MS if self.turbo_check.isChecked() else 500
+
+    def _on_turbo_toggled(self, checked):
+        # Switching mode mid-playback must switch the timer rate too
+        if self.timer.isActive():
+            self.timer.setInterval(self._interval())
+
+    def _tick(self):
+        if self.turbo_check.isChecked():
+            self.run_frame()
+        else:
+            self.next_step()
+
+    def run_frame(self):
+        # Step without touching the UI until the budget is spent, then repaint once
+        deadline = time.perf_counter() + self.budget_spin.value() / 1000
+        advanced = False
+
+        while self._advance():
+            advanced = True
+            if time.perf_counter() >= deadline:
+                break
+        else:
+            self.timer.stop()
+
+        if advanced:
+            self._refresh()
 
     def reset(self):
         self.timer.stop()
@@ -65,19 +125,47 @@ class CircularLock(QWidget):
         self.step_label.setText("Instruction: -")
         self.cross_label.setText("Zero Crossings: 0")
         self.stop_label.setText("Stops at 0 (Part 1): 0")
+        self._sync_slider()
 
         self.update()
 
+    def seek(self, index):
+        self.current_index = index
+        self.position = self.index.position_after(index)
+        self.zero_crossings = self.index.crossings_between(0, index)
+        self.zero_stops_live = self.index.stops_between(0, index)
+        self._refresh()
+
+    def _refresh(self):
+        if self.current_index > 0:
+            delta = int(self.instructions[self.current_index - 1])
+            self.step_label.setText(f"Instruction: {'R' if delta >= 0 else 'L'}{abs(delta)}")
+        else:
+            self.step_label.setText("Instruction: -")
+        self.cross_label.setText(f"Zero Crossings: {self.zero_crossings}")
+        self.stop_label.setText(f"Stops at 0 (Part 1): {self.zero_stops_live}")
+
+        self._sync_slider()
+        self.update(self._needle_rect())
+
+    def _sync_slider(self):
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setValue(self.current_index)
+        self.seek_slider.blockSignals(False)
+
     def next_step(self):
-        if self.current_index >= len(self.instructions):
+        if not self._advance():
             self.timer.stop()
             return
+        self._refresh()
 
-        instr = self.instructions[self.current_index]
-        direction = instr[0]
-        steps = int(instr[1:])
+    def _advance(self):
+        if self.current_index >= len(self.instructions):
+            return False
 
-        self.step_label.setText(f"Instruction: {instr}")
+        delta = int(self.instructions[self.current_index])
+        direction = "R" if delta >= 0 else "L"
+        steps = abs(delta)
 
         full_loops, move_steps = divmod(steps, 100)
         self.zero_crossings += full_loops
@@ -98,18 +186,23 @@ class CircularLock(QWidget):
         if self.position == 0:
             self.zero_stops_live += 1
 
-        # Update labels
-        self.cross_label.setText(f"Zero Crossings: {self.zero_crossings}")
-        self.stop_label.setText(f"Stops at 0 (Part 1): {self.zero_stops_live}")
-
         self.current_index += 1
-        self.update()
+        return True
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def resizeEvent(self, event):
+        self.dial_cache = None
+        super().resizeEvent(event)
+
+    def _render_dial(self):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        center = QPoint(self.width() // 2, self.height() // 2 + 50)
+        center = self._center()
         radius = 180
 
         # Draw circle
@@ -131,6 +224,29 @@ class CircularLock(QWidget):
         zy = center.y() + radius * math.sin(math.radians(zero_angle))
         painter.drawLine(center.x(), center.y(), int(zx), int(zy))
 
+        painter.end()
+        return pixmap
+
+    def _center(self):
+        return QPoint(self.width() // 2, self.height() // 2 + 50)
+
+    def _needle_rect(self):
+        # Only the area the needle can sweep needs repainting after a move
+        center = self._center()
+        reach = 180 + 5
+        return QRect(center.x() - reach, center.y() - reach, 2 * reach, 2 * reach)
+
+    def paintEvent(self, event):
+        if self.dial_cache is None:
+            self.dial_cache = self._render_dial()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.dial_cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        center = self._center()
+        radius = 180
+
         # Red needle = current position
         angle_deg = (self.position / 100) * 360 - 90
         rad = math.radians(angle_deg)
@@ -141,10 +257,6 @@ class CircularLock(QWidget):
         painter.drawLine(center.x(), center.y(), int(x), int(y))
 
 
-def load_instructions(file_path):
-    with open(file_path, "r") as f:
-        return [line.strip() for line in f if line.strip()]
-
 if __name__ == "__main__":
     instructions = load_instructions("input.txt")
     app = QApplication(sys.argv)
@@ -0,0 +1,71 @@
+# Compiled instruction files for day 1.
+# Parsing "L37"/"R21" text is most of the startup cost on big logs, so we do it once and save
+# the signed deltas as a packed .npy array next to the text file (input.txt -> input.dial.npy).
+# Later runs memory-map that array instead of reading the text at all. Next to the array we keep
+# the size and mtime of the text it was compiled from (input.dial.npy.src), and the loader
+# recompiles whenever either of them no longer matches, in whichever direction the mtime moved.
+
+import os
+
+import numpy as np
+
+from fast_dial import load_deltas
+
+COMPILED_SUFFIX = ".dial.npy"
+SOURCE_SUFFIX = ".src"
+
+
+def compiled_path(text_path):
+    root, _ = os.path.splitext(text_path)
+    return root + COMPILED_SUFFIX
+
+
+def source_stamp(text_path):
+    info = os.stat(text_path)
+    return f"{info.st_size} {info.st_mtime_ns}"
+
+
+def compile_instructions(text_path, out_path=None):
+    out_path = out_path or compiled_path(text_path)
+    # Stamp taken before reading, so an edit made while we parse forces a recompile next time
+    stamp = source_stamp(text_path)
+    deltas = load_deltas(text_path)
+
+    # int32 is plenty for real logs; only fall back to int64 for absurd step counts
+    info = np.iinfo(np.int32)
+    if len(deltas) == 0 or (deltas.min() >= info.min and deltas.max() <= info.max):
+        deltas = deltas.astype(np.int32)
+
+    # Write to a temp file first so a reader never maps a half-written array
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, deltas)
+    os.replace(tmp_path, out_path)
+
+    with open(out_path + SOURCE_SUFFIX, "w") as f:
+        f.write(stamp)
+    return out_path
+
+
+def load_compiled(path):
+    return np.load(path, mmap_mode="r")
+
+
+def is_stale(text_path, bin_path):
+    try:
+        with open(bin_path + SOURCE_SUFFIX, "r") as f:
+            recorded = f.read().strip()
+    except OSError:
+        return True
+    return not os.path.exists(bin_path) or recorded != source_stamp(text_path)
+
+
+def load_instructions(text_path):
+    bin_path = compiled_path(text_path)
+    if is_stale(text_path, bin_path):
+        compile_instructions(text_path, bin_path)
+    return load_compiled(bin_path)
+
+
+if __name__ == "__main__":
+    print(compile_instructions("input.txt"))
@@ -0,0 +1,53 @@
+# Prefix index over the day 1 instructions.
+# We run the NumPy engine once and keep three prefix arrays, all of length n + 1:
+# - positions[k]: where the dial points after the first k instructions
+# - stops[k]:     how many of the first k instructions ended on 0
+# - crossings[k]: how many times the first k instructions passed 0
+# Any range [i, j) of instructions is then just a difference of two entries,
+# and since crossings never decreases we can binary search it.
+
+import numpy as np
+
+from fast_dial import START, DIAL_SIZE, load_deltas, absolute_positions, zero_stops, zero_crossings
+
+
+class DialIndex:
+    def __init__(self, deltas, start=START, modulus=DIAL_SIZE):
+        self.positions = absolute_positions(deltas, start) % modulus
+        self.stops = np.concatenate(([0], np.cumsum(zero_stops(deltas, start, modulus))))
+        self.crossings = np.concatenate(([0], np.cumsum(zero_crossings(deltas, start, modulus))))
+
+    @classmethod
+    def from_file(cls, file_path, start=START, modulus=DIAL_SIZE):
+        return cls(load_deltas(file_path), start, modulus)
+
+    def __len__(self):
+        return len(self.positions) - 1
+
+    def _check_range(self, i, j):
+        if not 0 <= i <= j <= len(self):
+            raise IndexError(f"instruction range [{i}, {j}) out of bounds for {len(self)} instructions")
+
+    def position_after(self, k):
+        self._check_range(k, k)
+        return int(self.positions[k])
+
+    def stops_between(self, i, j):
+        self._check_range(i, j)
+        return int(self.stops[j] - self.stops[i])
+
+    def crossings_between(self, i, j):
+        self._check_range(i, j)
+        return int(self.crossings[j] - self.crossings[i])
+
+    def nth_crossing(self, n):
+        # Index (0-based) of the instruction during which the n-th crossing happens
+        if not 1 <= n <= self.crossings[-1]:
+            raise IndexError(f"there is no crossing number {n}")
+        return int(np.searchsorted(self.crossings, n)) - 1
+
+
+if __name__ == "__main__":
+    index = DialIndex.from_file("input.txt")
+    print(index.stops_between(0, len(index)))
+    print(index.crossings_between(0, len(index)))
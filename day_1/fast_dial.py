@@ -0,0 +1,150 @@
+# NumPy version of the dial solvers in part1.py and part2.py.
+# Instead of walking the instructions one by one, we turn the whole file into an array of
+# signed deltas (R21 -> +21, L37 -> -37) and work on it in bulk.
+#
+# If we never wrap the dial, the "absolute" position after instruction i is just
+# 50 + (sum of the first i deltas), so one cumsum gives us every position at once.
+# - Part 1: the dial points at 0 whenever the absolute position is a multiple of 100.
+# - Part 2: a right turn from a to b (a < b) passes 0 once for every multiple of 100 in (a, b],
+#   which is b // 100 - a // 100. A left turn from a to b (b < a) passes 0 for every multiple
+#   of 100 in [b, a), which is (a - 1) // 100 - (b - 1) // 100.
+# numpy's // floors for negative numbers too, so this works no matter how far left we go.
+
+import numpy as np
+
+START = 50
+DIAL_SIZE = 100
+
+
+def parse_bytes(raw):
+    buf = np.frombuffer(raw, dtype=np.uint8)
+
+    is_left = buf == ord("L")
+    is_dir = is_left | (buf == ord("R"))
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+
+    dir_pos = np.flatnonzero(is_dir)
+    if len(dir_pos) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Every digit belongs to the last direction letter before it
+    owner = np.cumsum(is_dir) - 1
+    digit_pos = np.flatnonzero(is_digit & (owner >= 0))
+    digit_owner = owner[digit_pos]
+    digits = (buf[digit_pos] - ord("0")).astype(np.int64)
+
+    # Place value of each digit = how many digits of the same number come after it
+    lengths = np.bincount(digit_owner, minlength=len(dir_pos))
+    if np.any(lengths == 0):
+        raise ValueError("instruction without a step count")
+
+    firsts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    rank = np.arange(len(digit_pos)) - firsts[digit_owner]
+    powers = 10 ** (lengths[digit_owner] - rank - 1)
+
+    steps = np.add.reduceat(digits * powers, firsts)
+    return np.where(is_left[dir_pos], -steps, steps)
+
+
+def load_deltas(file_path):
+    with open(file_path, "rb") as f:
+        return parse_bytes(f.read())
+
+
+def absolute_positions(deltas, start=START):
+    positions = np.empty(len(deltas) + 1, dtype=np.int64)
+    positions[0] = start
+    np.cumsum(deltas, out=positions[1:])
+    positions[1:] += start
+    return positions
+
+
+def zero_stops(deltas, start=START, modulus=DIAL_SIZE):
+    positions = absolute_positions(deltas, start)
+    return positions[1:] % modulus == 0
+
+
+def zero_crossings(deltas, start=START, modulus=DIAL_SIZE):
+    positions = absolute_positions(deltas, start)
+    before, after = positions[:-1], positions[1:]
+
+    right = after // modulus - before // modulus
+    left = (before - 1) // modulus - (after - 1) // modulus
+    return np.where(deltas >= 0, right, left)
+
+
+# A run of instructions is really a function of where the dial starts.
+# summarize() computes, for every start 0..modulus-1 at once, the end position, the number of
+# stops at 0 and the number of zero crossings, without simulating each start separately.
+#
+# Write each prefix sum as c = q * modulus + r. Starting from p, the absolute position is p + c,
+# and (p + c) // modulus = q + (1 if r >= modulus - p else 0). So every crossing count is a
+# constant (from the q's) plus a count of r's that are >= modulus - p, which a histogram of the
+# r's answers for every p with one suffix sum. Stops work the same way: p + c is a multiple of
+# modulus exactly when c % modulus == -p % modulus.
+def summarize(deltas, modulus=DIAL_SIZE):
+    return _summary_tables(absolute_positions(deltas, 0), deltas >= 0, modulus)
+
+
+def _summary_tables(prefix, right, modulus):
+    left = ~right
+
+    starts = np.arange(modulus)
+    end = (starts + prefix[-1]) % modulus
+
+    hits = np.bincount(prefix[1:] % modulus, minlength=modulus)
+    stops = hits[-starts % modulus]
+
+    q, r = np.divmod(prefix, modulus)
+    ql, rl = np.divmod(prefix - 1, modulus)
+
+    base = (q[1:] - q[:-1])[right].sum() + (ql[:-1] - ql[1:])[left].sum()
+    histogram = (
+        np.bincount(r[1:][right], minlength=modulus)
+        - np.bincount(r[:-1][right], minlength=modulus)
+        + np.bincount(rl[:-1][left], minlength=modulus)
+        - np.bincount(rl[1:][left], minlength=modulus)
+    )
+    at_least = np.concatenate((np.cumsum(histogram[::-1])[::-1], [0]))
+    crossings = base + at_least[modulus - starts]
+
+    return end, stops, crossings
+
+
+# Batch mode: answers for many (start, modulus) dials over the same instructions.
+# The prefix sums are computed once; every distinct modulus then costs one histogram pass
+# (see summarize), and each configuration is just a lookup at its start position.
+def simulate_batch(deltas, configs):
+    configs = np.asarray(configs, dtype=np.int64).reshape(-1, 2)
+    starts, moduli = configs[:, 0], configs[:, 1]
+    if np.any(moduli <= 0):
+        raise ValueError("dial sizes must be positive")
+
+    prefix = absolute_positions(deltas, 0)
+    right = deltas >= 0
+
+    end = np.empty(len(configs), dtype=np.int64)
+    stops = np.empty(len(configs), dtype=np.int64)
+    crossings = np.empty(len(configs), dtype=np.int64)
+
+    for modulus in np.unique(moduli):
+        rows = np.flatnonzero(moduli == modulus)
+        at = starts[rows] % modulus
+        tables = _summary_tables(prefix, right, int(modulus))
+        end[rows], stops[rows], crossings[rows] = (table[at] for table in tables)
+
+    return end, stops, crossings
+
+
+def count_zeros(deltas):
+    return int(np.count_nonzero(zero_stops(deltas)))
+
+
+def count_zero_crossings(deltas):
+    return int(zero_crossings(deltas).sum())
+
+
+if __name__ == "__main__":
+    deltas = load_deltas("input.txt")
+    print(count_zeros(deltas))
+    print(count_zero_crossings(deltas))
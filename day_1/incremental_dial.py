@@ -0,0 +1,151 @@
+# Incremental re-evaluation of the day 1 answers.
+# Our logs mostly grow by appends and only occasionally get a line edited, so recomputing
+# from instruction 0 every time is wasteful. Next to the input we keep a checkpoint file
+# (input.txt -> input.dial.ckpt.npz) holding, every CHECKPOINT_EVERY instructions:
+# - the byte offset where that instruction starts
+# - the dial position, stops at 0 and zero crossings before it
+# - a hash of the bytes of the block up to the next checkpoint
+# plus the size of the file the checkpoints were built from.
+#
+# Appends take a fast path: if the file grew and its last full block still hashes the same, we
+# treat it as an append and resume from the last checkpoint. That reads one block plus the new
+# tail, so the cost follows the size of the change, not of the file. (An edit further back that
+# lands together with an append is not noticed.)
+# Anything else (same size, shrunk, or last block changed) hashes every block again to find the
+# first one that changed, and parses and simulates from the checkpoint at its start. Hashing is
+# much cheaper than parsing, but edit detection is still O(file). Blocks are read one at a time,
+# and only the tail from the resume point is held in memory.
+
+import hashlib
+import os
+
+import numpy as np
+
+from fast_dial import START, DIAL_SIZE, parse_bytes, absolute_positions, zero_stops, zero_crossings
+
+CHECKPOINT_EVERY = 4096
+CHECKPOINT_SUFFIX = ".dial.ckpt.npz"
+
+
+def checkpoint_path(text_path):
+    root, _ = os.path.splitext(text_path)
+    return root + CHECKPOINT_SUFFIX
+
+
+def block_digest(raw):
+    return np.frombuffer(hashlib.blake2b(raw, digest_size=16).digest(), dtype=np.uint8)
+
+
+def load_checkpoints(path, every):
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        if "size" not in data.files or int(data["every"]) != every:
+            return None
+        return {name: data[name] for name in ("offsets", "positions", "stops", "crossings", "digests", "size")}
+
+
+def save_checkpoints(path, checkpoints, every):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, every=every, **checkpoints)
+    os.replace(tmp_path, path)
+
+
+def initial_checkpoints():
+    return {
+        "offsets": np.array([0], dtype=np.int64),
+        "positions": np.array([START], dtype=np.int64),
+        "stops": np.array([0], dtype=np.int64),
+        "crossings": np.array([0], dtype=np.int64),
+        "digests": np.zeros((0, 16), dtype=np.uint8),
+        "size": np.array(0, dtype=np.int64),
+    }
+
+
+def read_block(f, begin, end):
+    f.seek(begin)
+    return f.read(end - begin)
+
+
+def is_append(f, size, checkpoints):
+    offsets, digests = checkpoints["offsets"], checkpoints["digests"]
+    if size <= int(checkpoints["size"]):
+        return False
+    if len(digests) == 0:
+        return True
+
+    begin, end = int(offsets[-2]), int(offsets[-1])
+    return np.array_equal(block_digest(read_block(f, begin, end)), digests[-1])
+
+
+def first_changed_block(f, size, checkpoints):
+    offsets, digests = checkpoints["offsets"], checkpoints["digests"]
+
+    for block in range(len(digests)):
+        begin, end = int(offsets[block]), int(offsets[block + 1])
+        if end > size or not np.array_equal(block_digest(read_block(f, begin, end)), digests[block]):
+            return block
+
+    return len(digests)
+
+
+def resume(tail, checkpoints, block, every):
+    # tail holds the file's bytes from the checkpoint at the start of `block` onwards
+    begin = int(checkpoints["offsets"][block])
+    position = int(checkpoints["positions"][block])
+    stops = int(checkpoints["stops"][block])
+    crossings = int(checkpoints["crossings"][block])
+
+    deltas = parse_bytes(tail)
+    buf = np.frombuffer(tail, dtype=np.uint8)
+    starts = np.flatnonzero((buf == ord("L")) | (buf == ord("R"))) + begin
+
+    positions = absolute_positions(deltas, position) % DIAL_SIZE
+    stop_prefix = stops + np.concatenate(([0], np.cumsum(zero_stops(deltas, position))))
+    cross_prefix = crossings + np.concatenate(([0], np.cumsum(zero_crossings(deltas, position))))
+
+    # New checkpoints inside the recomputed tail, every `every` instructions
+    marks = np.arange(every, len(deltas), every)
+    offsets = np.concatenate((checkpoints["offsets"][:block + 1], starts[marks]))
+
+    bounds = offsets[block:]
+    digests = [block_digest(tail[a - begin:b - begin]) for a, b in zip(bounds, bounds[1:])]
+    digests = np.concatenate((checkpoints["digests"][:block], np.array(digests, dtype=np.uint8).reshape(-1, 16)))
+
+    updated = {
+        "offsets": offsets,
+        "positions": np.concatenate((checkpoints["positions"][:block + 1], positions[marks])),
+        "stops": np.concatenate((checkpoints["stops"][:block + 1], stop_prefix[marks])),
+        "crossings": np.concatenate((checkpoints["crossings"][:block + 1], cross_prefix[marks])),
+        "digests": digests,
+        "size": np.array(begin + len(tail), dtype=np.int64),
+    }
+    return updated, int(stop_prefix[-1]), int(cross_prefix[-1])
+
+
+def update(text_path, every=CHECKPOINT_EVERY):
+    path = checkpoint_path(text_path)
+    checkpoints = load_checkpoints(path, every) or initial_checkpoints()
+
+    with open(text_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if is_append(f, size, checkpoints):
+            block = len(checkpoints["digests"])
+        else:
+            block = first_changed_block(f, size, checkpoints)
+
+        f.seek(int(checkpoints["offsets"][block]))
+        tail = f.read()
+
+    checkpoints, stops, crossings = resume(tail, checkpoints, block, every)
+    save_checkpoints(path, checkpoints, every)
+
+    return stops, crossings, block * every
+
+
+if __name__ == "__main__":
+    part1, part2, resumed_at = update("input.txt")
+    print(f"(resumed from instruction {resumed_at})")
+    print(part1)
+    print(part2)
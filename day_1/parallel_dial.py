@@ -0,0 +1,83 @@
+# Multi-core version of the day 1 solvers.
+# fast_dial.summarize() turns a chunk of instructions into three lookup tables indexed by the
+# start position: where the dial ends, how many times it stopped at 0 and how many times it
+# crossed 0. Two of those summaries compose into the summary of both chunks back to back:
+#
+#   end[p]       = second.end[first.end[p]]
+#   stops[p]     = first.stops[p] + second.stops[first.end[p]]
+#   crossings[p] = first.crossings[p] + second.crossings[first.end[p]]
+#
+# Composition is associative, so we can cut the file into chunks at line boundaries,
+# summarize the chunks on a process pool and fold the summaries together in order.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from fast_dial import START, DIAL_SIZE, parse_bytes, summarize
+
+
+def split_file(file_path, chunks):
+    size = os.path.getsize(file_path)
+    bounds = [0]
+
+    with open(file_path, "rb") as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def summarize_range(file_path, begin, end, modulus=DIAL_SIZE):
+    with open(file_path, "rb") as f:
+        f.seek(begin)
+        raw = f.read(end - begin)
+    return summarize(parse_bytes(raw), modulus)
+
+
+def compose(first, second):
+    first_end, first_stops, first_crossings = first
+    second_end, second_stops, second_crossings = second
+
+    return (
+        second_end[first_end],
+        first_stops + second_stops[first_end],
+        first_crossings + second_crossings[first_end],
+    )
+
+
+def identity(modulus=DIAL_SIZE):
+    starts = np.arange(modulus)
+    zeros = np.zeros(modulus, dtype=np.int64)
+    return starts, zeros, zeros
+
+
+def summarize_file(file_path, workers=None, modulus=DIAL_SIZE):
+    workers = workers or os.cpu_count() or 1
+    ranges = split_file(file_path, workers * 4)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(
+            summarize_range,
+            [file_path] * len(ranges),
+            [a for a, _ in ranges],
+            [b for _, b in ranges],
+            [modulus] * len(ranges),
+        )
+        return reduce(compose, parts, identity(modulus))
+
+
+def solve(file_path, workers=None):
+    _, stops, crossings = summarize_file(file_path, workers)
+    return int(stops[START]), int(crossings[START])
+
+
+if __name__ == "__main__":
+    part1, part2 = solve("input.txt")
+    print(part1)
+    print(part2)
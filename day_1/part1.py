@@ -6,9 +6,6 @@
 # We will be given a list containing stuff like L10, R21 etc.
 # We need to find how many times we point to 0 while following the instructions.
 
-with open("input.txt", "r") as f:
-    lines = [line.strip() for line in f]
-
 def count_zeros(instructions):
     position = 50
     zero_count = 0
@@ -27,5 +24,11 @@ def count_zeros(instructions):
 
     return zero_count
 
-result = count_zeros(lines)
-print(result)
+if __name__ == "__main__":
+    # The loop above is the readable version. For the real run we memory-map the compiled
+    # instruction array (see dial_binary.py) and let the NumPy engine do the work.
+    import fast_dial
+    from dial_binary import load_instructions
+
+    result = fast_dial.count_zeros(load_instructions("input.txt"))
+    print(result)
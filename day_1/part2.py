@@ -5,9 +5,6 @@
 # Be careful: if the dial were pointing at 50, a single rotation like R1000 would cause the dial to point at 0 ten times before returning back to 50!
 
 
-with open("input.txt", "r") as f:
-    lines = [line.strip() for line in f]
-
 def count_zero_crossings(instructions):
     position = 50
     zero_crossings = 0
@@ -30,6 +27,12 @@ def count_zero_crossings(instructions):
 
     return zero_crossings
 
-result = count_zero_crossings(lines)
-print(result)
+if __name__ == "__main__":
+    # The loop above is the readable version. For the real run we memory-map the compiled
+    # instruction array (see dial_binary.py) and let the NumPy engine do the work.
+    import fast_dial
+    from dial_binary import load_instructions
+
+    result = fast_dial.count_zero_crossings(load_instructions("input.txt"))
+    print(result)
 
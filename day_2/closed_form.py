@@ -0,0 +1,138 @@
+# Closed-form version of day 2.
+# Looping over every ID is hopeless for ranges like 9595822750-9596086139, so we count instead.
+#
+# A part 1 invalid ID with 2k digits is some k-digit number X written twice, and writing X
+# twice is the same as X * (10^k + 1). For example 1212 = 12 * 101.
+# So inside [start, end] the invalid 2k-digit IDs are (10^k + 1) * X for every X in
+#   max(10^(k-1), ceil(start / (10^k + 1))) .. min(10^k - 1, end // (10^k + 1))
+# and their sum is (10^k + 1) times an arithmetic series. One step per digit length.
+#
+# Part 2 allows any number of repeats: an L-digit ID is invalid if it is some d-digit block
+# repeated L/d times, for a proper divisor d of L. Each of those sets is again a multiple of a
+# fixed factor, (10^L - 1) / (10^d - 1), so it sums the same way. The sets overlap though
+# (222222 repeats "2", "22" and "222"), so we use Moebius inclusion-exclusion: counting every
+# number by its shortest block, the union over proper divisors d is
+#   - sum over d | L, d < L of mu(L / d) * (numbers made of a repeated d-digit block)
+#
+# The brute-force loops in part1.py / part2.py are only used to double check the answers.
+# process_file and verify read the input through pipeline.read_ranges, like part1.py / part2.py,
+# so overlapping ranges are merged first and verify compares both engines on the merged ranges.
+
+import part1
+import part2
+from pipeline import read_ranges
+
+
+def parse_range(range_str):
+    start, end = map(int, range_str.split('-'))
+    return start, end
+
+
+def repeated_block_stats(start, end, length, block):
+    # Count and sum of the `length`-digit numbers in [start, end] made by repeating
+    # one `block`-digit number (block must divide length)
+    factor = (10 ** length - 1) // (10 ** block - 1)
+    lo = max(10 ** (block - 1), -(-start // factor))
+    hi = min(10 ** block - 1, end // factor)
+
+    if lo > hi:
+        return 0, 0
+
+    count = hi - lo + 1
+    return count, factor * (lo + hi) * count // 2
+
+
+def divisors(n):
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+def mobius(n):
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def part1_stats(start, end):
+    count = total = 0
+
+    for k in range(1, len(str(end)) // 2 + 1):
+        c, s = repeated_block_stats(start, end, 2 * k, k)
+        count += c
+        total += s
+
+    return count, total
+
+
+def part2_stats(start, end):
+    count = total = 0
+
+    for length in range(2, len(str(end)) + 1):
+        for block in divisors(length)[:-1]:
+            mu = mobius(length // block)
+            if mu == 0:
+                continue
+            c, s = repeated_block_stats(start, end, length, block)
+            count -= mu * c
+            total -= mu * s
+
+    return count, total
+
+
+def block_lengths(length, part):
+    if part == 1:
+        return [length // 2] if length % 2 == 0 else []
+    return divisors(length)[:-1]
+
+
+def next_invalid(n, part=1):
+    # Smallest invalid ID >= n: for each block length, the smallest multiple of the repeat
+    # factor that is >= n and still has a block of the right size
+    n = max(n, 1)
+    length = len(str(n))
+
+    while True:
+        candidates = []
+        for block in block_lengths(length, part):
+            factor = (10 ** length - 1) // (10 ** block - 1)
+            x = max(10 ** (block - 1), -(-n // factor))
+            if x < 10 ** block:
+                candidates.append(x * factor)
+        if candidates:
+            return min(candidates)
+
+        length += 1
+        n = 10 ** (length - 1)
+
+
+STATS = {1: part1_stats, 2: part2_stats}
+BRUTE_FORCE = {1: part1.sum_invalid_between, 2: part2.sum_invalid_between}
+
+
+def sum_of_invalid_ids(range_str, part=1):
+    return STATS[part](*parse_range(range_str))[1]
+
+
+def process_file(filename, part=1):
+    return sum(STATS[part](start, end)[1] for start, end in read_ranges(filename))
+
+
+def verify(filename, part=1):
+    # Slow: runs the brute-force loop from part1.py / part2.py on every range
+    for start, end in read_ranges(filename):
+        fast, slow = STATS[part](start, end)[1], BRUTE_FORCE[part](start, end)
+        if fast != slow:
+            raise AssertionError(f"{start}-{end}: closed form gave {fast}, brute force gave {slow}")
+
+    return True
+
+
+if __name__ == "__main__":
+    print(process_file("input.txt", 1))
+    print(process_file("input.txt", 2))
@@ -0,0 +1,90 @@
+# Exhaustive day 2 checker that tests whole blocks of IDs at once with integer maths only.
+# No strings: an L-digit ID made of a d-digit block repeated L/d times is exactly a multiple of
+#   (10^L - 1) / (10^d - 1)        e.g. 123123 = 123 * 1001, 121212 = 12 * 10101
+# and any L-digit multiple of that factor has that shape. So:
+# - Part 1 (exactly two repeats): L is even and the ID is divisible by 10^(L/2) + 1
+# - Part 2 (any repeats): the ID is divisible by the factor for some proper divisor d of L.
+#   It is enough to try d = L / p for the primes p dividing L, since every other proper
+#   divisor's factor is a multiple of one of those.
+# Consecutive IDs are sorted, so each digit length is one contiguous slice of the block.
+# This is meant as a fast oracle for closed_form.py, not a replacement for it.
+# process_file reads the input through pipeline.read_ranges, so like the other engines it scans the
+# merged ranges: an ID covered by two overlapping input ranges is counted once.
+
+import numpy as np
+
+from pipeline import read_ranges
+
+MAX_DIGITS = 18
+POWERS = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+BLOCK_SIZE = 1 << 20
+
+
+def prime_factors(n):
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def repeat_factor(length, block):
+    return (10 ** length - 1) // (10 ** block - 1)
+
+
+def check_block(start, count):
+    if start < 0 or start + count > 10 ** MAX_DIGITS:
+        raise ValueError(f"IDs must be between 0 and 10^{MAX_DIGITS}")
+
+    ids = np.arange(start, start + count, dtype=np.int64)
+    mask1 = np.zeros(count, dtype=bool)
+    mask2 = np.zeros(count, dtype=bool)
+
+    # bounds[L] = first index in the block with at least L + 1 digits
+    bounds = np.searchsorted(ids, POWERS)
+    lo = 0
+    for length in range(1, MAX_DIGITS + 1):
+        hi = bounds[length]
+        if lo < hi:
+            chunk = ids[lo:hi]
+            if length % 2 == 0:
+                mask1[lo:hi] = chunk % repeat_factor(length, length // 2) == 0
+            for p in prime_factors(length):
+                mask2[lo:hi] |= chunk % repeat_factor(length, length // p) == 0
+        lo = hi
+
+    sum1 = sum(ids[mask1].tolist())
+    sum2 = sum(ids[mask2].tolist())
+    return mask1, mask2, sum1, sum2
+
+
+def scan_range(start, end, block_size=BLOCK_SIZE):
+    sum1 = sum2 = 0
+    while start <= end:
+        count = min(block_size, end - start + 1)
+        _, _, s1, s2 = check_block(start, count)
+        sum1 += s1
+        sum2 += s2
+        start += count
+    return sum1, sum2
+
+
+def process_file(filename):
+    total1 = total2 = 0
+    for start, end in read_ranges(filename):
+        s1, s2 = scan_range(start, end)
+        total1 += s1
+        total2 += s2
+    return total1, total2
+
+
+if __name__ == "__main__":
+    part1_total, part2_total = process_file("input.txt")
+    print(part1_total)
+    print(part2_total)
@@ -6,31 +6,40 @@
 # It's not possible to have a invalid ID with odd number of digits.
 # So, let's implement the function to find the sum of invalid IDs in the given range.
 
+from pipeline import read_ranges, run_sharded
+
+
+def is_invalid_id(id_str):
+    length = len(id_str)
+    if length % 2 != 0:
+        return False
+    half = length // 2
+    return id_str[:half] == id_str[half:]
+
+
 def sum_of_invalid_ids(range_str):
     start, end = map(int, range_str.split('-'))
+    return sum_invalid_between(start, end)
+
+
+def sum_invalid_between(start, end):
     invalid_sum = 0
 
     for id_num in range(start, end + 1):
-        id_str = str(id_num)
-        length = len(id_str)
-
-        if length % 2 == 0:
-            half = length // 2
-            if id_str[:half] == id_str[half:]:
-                invalid_sum += id_num
+        if is_invalid_id(str(id_num)):
+            invalid_sum += id_num
 
     return invalid_sum
 
 
-def process_file(filename):
-    with open(filename, "r") as f:
-        content = f.read().strip()
-
-    ranges = [r for r in content.split(",") if r]
+def process_file(filename, workers=None):
+    # Overlapping ranges are merged first, so every ID is counted once
+    ranges = read_ranges(filename)
 
-    total = sum(sum_of_invalid_ids(r) for r in ranges)
+    total = run_sharded(sum_invalid_between, ranges, workers)
     return total
 
 
-print(process_file("input.txt"))
+if __name__ == "__main__":
+    print(process_file("input.txt"))
 
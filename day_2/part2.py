@@ -1,3 +1,6 @@
+from pipeline import read_ranges, run_sharded
+
+
 def is_invalid_id(id_str):
     doubled = (id_str + id_str)[1:-1]
     return id_str in doubled
@@ -5,6 +8,10 @@ def is_invalid_id(id_str):
 
 def sum_of_invalid_ids(range_str):
     start, end = map(int, range_str.split('-'))
+    return sum_invalid_between(start, end)
+
+
+def sum_invalid_between(start, end):
     total = 0
 
     for id_num in range(start, end + 1):
@@ -14,13 +21,12 @@ def sum_of_invalid_ids(range_str):
     return total
 
 
-def process_file(filename):
-    with open(filename, "r") as f:
-        content = f.read().strip()
-
-    ranges = [r for r in content.split(",") if r]
-    return sum(sum_of_invalid_ids(r) for r in ranges)
+def process_file(filename, workers=None):
+    # Overlapping ranges are merged first, so every ID is counted once
+    ranges = read_ranges(filename)
+    return run_sharded(sum_invalid_between, ranges, workers)
 
 
-print(process_file("input.txt"))
+if __name__ == "__main__":
+    print(process_file("input.txt"))
 
@@ -0,0 +1,76 @@
+# Shared range handling for the brute-force day 2 solvers.
+# 1. Merge overlapping or touching ranges so no ID is scanned twice.
+# 2. Cut the merged ranges into work units of about the same width
+#    (a unit can span several small ranges, or be one slice of a huge one).
+# 3. Run the per-ID check on a process pool and add up the results.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Below this many IDs starting a pool costs more than it saves
+MIN_PARALLEL_WIDTH = 200_000
+
+
+def parse_ranges(content):
+    ranges = []
+    for r in content.split(","):
+        if r:
+            start, end = map(int, r.split('-'))
+            ranges.append((start, end))
+    return ranges
+
+
+def merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def read_ranges(filename):
+    # Every day 2 solver reads its input through here, so they all see the same merged ranges
+    with open(filename, "r") as f:
+        content = f.read().strip()
+    return merge_ranges(parse_ranges(content))
+
+
+def total_width(ranges):
+    return sum(end - start + 1 for start, end in ranges)
+
+
+def split_work(ranges, units):
+    target = max(1, -(-total_width(ranges) // units))
+    pieces = []
+
+    for start, end in ranges:
+        while end - start + 1 > target:
+            pieces.append((start, start + target - 1))
+            start += target
+        pieces.append((start, end))
+
+    # Glue small neighbouring pieces back together until they reach the target width
+    work = []
+    for piece in pieces:
+        if work and total_width(work[-1]) + total_width([piece]) <= target:
+            work[-1].append(piece)
+        else:
+            work.append([piece])
+    return work
+
+
+def _run_unit(fn, unit):
+    return sum(fn(start, end) for start, end in unit)
+
+
+def run_sharded(fn, ranges, workers=None):
+    # fn(start, end) must be a top-level function so the pool can pickle it
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or total_width(ranges) < MIN_PARALLEL_WIDTH:
+        return sum(fn(start, end) for start, end in ranges)
+
+    units = split_work(ranges, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_run_unit, [fn] * len(units), units))
@@ -0,0 +1,97 @@
+# "How many invalid IDs are <= N, and what do they add up to?" for both part rules.
+# With that, any range [start, end] is just upto(end) - upto(start - 1).
+#
+# We precompute, per digit length L, the count and sum of ALL invalid L-digit IDs, and keep
+# running totals over the lengths. A query for N then takes the totals for every length
+# shorter than N, plus one closed-form call for the L-digit IDs between 10^(L-1) and N.
+# The tables are tiny, so they are memoized in the process and saved to disk as JSON.
+# process_file reads the input through pipeline.read_ranges, so overlapping ranges are merged first.
+
+import json
+import os
+
+from closed_form import STATS
+from pipeline import read_ranges
+
+MAX_DIGITS = 30
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "invalid_id_tables.json")
+
+_tables = {}
+
+
+def build_table(part):
+    # below[L] = (count, sum) of invalid IDs with fewer than L digits
+    below = [(0, 0), (0, 0)]
+    for length in range(1, MAX_DIGITS + 1):
+        count, total = STATS[part](10 ** (length - 1), 10 ** length - 1)
+        prev_count, prev_total = below[-1]
+        below.append((prev_count + count, prev_total + total))
+    return below
+
+
+def _load_tables():
+    try:
+        with open(TABLE_FILE, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if data.get("max_digits") != MAX_DIGITS:
+        return {}
+    return {int(part): [tuple(row) for row in rows] for part, rows in data["tables"].items()}
+
+
+def _save_tables():
+    data = {"max_digits": MAX_DIGITS, "tables": {str(part): rows for part, rows in _tables.items()}}
+    tmp_path = TABLE_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, TABLE_FILE)
+
+
+def get_table(part):
+    if part not in _tables:
+        _tables.update(_load_tables())
+    if part not in _tables:
+        _tables[part] = build_table(part)
+        try:
+            _save_tables()
+        except OSError:
+            pass  # read-only checkout, the in-memory copy still works
+    return _tables[part]
+
+
+def stats_upto(n, part=1):
+    if n <= 0:
+        return 0, 0
+
+    length = len(str(n))
+    if length > MAX_DIGITS:
+        raise ValueError(f"{n} has more than {MAX_DIGITS} digits")
+
+    below_count, below_total = get_table(part)[length]
+    count, total = STATS[part](10 ** (length - 1), n)
+    return below_count + count, below_total + total
+
+
+def count_upto(n, part=1):
+    return stats_upto(n, part)[0]
+
+
+def sum_upto(n, part=1):
+    return stats_upto(n, part)[1]
+
+
+def range_stats(start, end, part=1):
+    hi_count, hi_total = stats_upto(end, part)
+    lo_count, lo_total = stats_upto(start - 1, part)
+    return hi_count - lo_count, hi_total - lo_total
+
+
+def process_file(filename, part=1):
+    return sum(range_stats(start, end, part)[1] for start, end in read_ranges(filename))
+
+
+if __name__ == "__main__":
+    print(process_file("input.txt", 1))
+    print(process_file("input.txt", 2))
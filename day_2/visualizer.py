@@ -1,9 +1,40 @@
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QTextEdit, QListWidget, QSlider, QSpinBox, QMessageBox
+    QLineEdit, QTextEdit, QListView, QSlider, QSpinBox, QMessageBox, QCheckBox
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex
+
+from closed_form import next_invalid
+from prefix_table import range_stats
+
+
+class InvalidIDListModel(QAbstractListModel):
+    # Append-only list of invalid IDs. The view only asks for the rows it shows,
+    # and each append inserts one row instead of rebuilding the whole list.
+    def __init__(self):
+        super().__init__()
+        self._ids = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return str(self._ids[index.row()])
+        return None
+
+    def append(self, id_):
+        row = len(self._ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.append(id_)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._ids = []
+        self.endResetModel()
+
 
 class PyQtInvalidIDVisualizer(QWidget):
     def __init__(self):
@@ -16,7 +47,8 @@ class PyQtInvalidIDVisualizer(QWidget):
         self.range_start = None
         self.range_end = None
         self.current_id = None
-        self.invalid_ids = []
+        self.invalid_ids = InvalidIDListModel()
+        self.invalid_count = 0
         self.total_sum = 0
         self.is_playing = False
 
@@ -91,6 +123,14 @@ class PyQtInvalidIDVisualizer(QWidget):
         ctrl.addWidget(self.step_btn)
         ctrl.addWidget(self.reset_btn)
 
+        # skip mode: after each step jump straight to the next invalid ID
+        self.skip_check = QCheckBox("Skip valid IDs")
+        ctrl.addWidget(self.skip_check)
+        # fast-forward: count the rest of the range without visiting it
+        self.finish_btn = QPushButton("⏩ Finish")
+        self.finish_btn.clicked.connect(self.fast_forward)
+        ctrl.addWidget(self.finish_btn)
+
         # speed slider
         ctrl.addWidget(QLabel("Speed:"))
         self.speed_slider = QSlider(Qt.Orientation.Horizontal)
@@ -130,7 +170,10 @@ class PyQtInvalidIDVisualizer(QWidget):
 
         # invalid list
         right_col.addWidget(QLabel("Invalid IDs:"))
-        self.invalid_list = QListWidget()
+        self.invalid_list = QListView()
+        self.invalid_list.setModel(self.invalid_ids)
+        self.invalid_list.setUniformItemSizes(True)
+        self.invalid_list.setLayoutMode(QListView.LayoutMode.Batched)
         right_col.addWidget(self.invalid_list)
 
         vis_row.addLayout(right_col, stretch=1)
@@ -176,15 +219,13 @@ class PyQtInvalidIDVisualizer(QWidget):
         # labels
         self.current_label.setText(f"Checking: {self.current_id}" if self.current_id is not None else "Checking: -")
         self.visual_box.setPlainText(self._visualize_current())
-        self.count_label.setText(str(len(self.invalid_ids)))
+        self.count_label.setText(str(self.invalid_count))
         self.sum_label.setText(str(self.total_sum))
-        self.invalid_list.clear()
-        for id_ in self.invalid_ids:
-            self.invalid_list.addItem(str(id_))
 
         # enable/disable buttons
         self.play_btn.setEnabled(self.current_id is not None and not (self.current_id > (self.range_end or -1)))
         self.step_btn.setEnabled(not self.is_playing and self.current_id is not None and not (self.current_id > (self.range_end or -1)))
+        self.finish_btn.setEnabled(self.current_id is not None and not (self.current_id > (self.range_end or -1)))
 
     # ---------- range / start / reset ----------
     def start_range(self):
@@ -207,7 +248,8 @@ class PyQtInvalidIDVisualizer(QWidget):
         self.range_start = s
         self.range_end = e
         self.current_id = s
-        self.invalid_ids = []
+        self.invalid_ids.clear()
+        self.invalid_count = 0
         self.total_sum = 0
         self.is_playing = False
         self.timer.stop()
@@ -218,7 +260,8 @@ class PyQtInvalidIDVisualizer(QWidget):
         self.timer.stop()
         self.is_playing = False
         self.current_id = None
-        self.invalid_ids = []
+        self.invalid_ids.clear()
+        self.invalid_count = 0
         self.total_sum = 0
         self._update_ui()
 
@@ -234,10 +277,29 @@ class PyQtInvalidIDVisualizer(QWidget):
         # do check
         if self.is_invalid(self.current_id):
             self.invalid_ids.append(self.current_id)
+            self.invalid_count += 1
             self.total_sum += self.current_id
+            self.invalid_list.scrollToBottom()
 
         # move next
         self.current_id += 1
+        if self.skip_check.isChecked():
+            self.current_id = min(next_invalid(self.current_id, self.current_part), self.range_end + 1)
+        self._update_ui()
+
+    def fast_forward(self):
+        if self.current_id is None or self.current_id > self.range_end:
+            return
+
+        # Closed-form count / sum of everything left; the skipped IDs are not listed
+        count, total = range_stats(self.current_id, self.range_end, self.current_part)
+        self.invalid_count += count
+        self.total_sum += total
+        self.current_id = self.range_end + 1
+
+        self.is_playing = False
+        self.timer.stop()
+        self.play_btn.setText("▶ Play")
         self._update_ui()
 
     def toggle_play(self):
@@ -255,14 +317,14 @@ class PyQtInvalidIDVisualizer(QWidget):
         self._update_ui()
 
     def _tick(self):
-        # one tick -> perform a step
+        # one tick -> perform a step (step_forward already refreshes the UI)
         self.step_forward()
         # stop if reached end
         if self.current_id is None or self.current_id > self.range_end:
             self.is_playing = False
             self.timer.stop()
             self.play_btn.setText("▶ Play")
-        self._update_ui()
+            self._update_ui()
 
     # ---------- visualization text ----------
     def _visualize_current(self):
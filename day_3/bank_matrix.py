@@ -0,0 +1,169 @@
+# Whole-file NumPy version of day 3.
+# All the banks in our inputs have the same number of digits, so the file is really a
+# (lines x width) grid of digits. We load it with np.frombuffer and solve every line at once.
+#
+# Part 1: for each position j we want the biggest digit strictly to its right. Reversing the
+# rows and running np.maximum.accumulate gives the running max from the right, so
+# digit[j] * 10 + suffix_max[j + 1] is the best pair starting at j, and the row max is the answer.
+#
+# Part 2: the greedy "take the biggest digit that still leaves enough digits after it" picks
+# output digit t from the window [start, width - keep + t] of each row, where start is just
+# after the previous pick. Every row does the same step at the same time, so we mask each
+# row's window and take one argmax over the whole matrix per output digit (argmax returns the
+# leftmost maximum, which is the one the greedy wants). That is keep passes over the matrix.
+
+import numpy as np
+
+
+def matrix_from_bytes(raw):
+    raw = raw.rstrip(b"\r\n")
+    if not raw:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    width = raw.index(b"\n") if b"\n" in raw else len(raw)
+    newline = b"\n"
+    if raw[width - 1:width] == b"\r":
+        width -= 1
+        newline = b"\r\n"
+    stride = width + len(newline)
+
+    buf = np.frombuffer(raw + newline, dtype=np.uint8)
+    if len(buf) % stride != 0 or np.any(buf[stride - 1::stride] != ord("\n")):
+        raise ValueError("all lines must have the same length")
+
+    digits = buf.reshape(-1, stride)[:, :width] - ord("0")
+    if np.any(digits > 9):
+        raise ValueError("lines must only contain digits")
+    return digits
+
+
+def load_matrix(file_path):
+    with open(file_path, "rb") as f:
+        return matrix_from_bytes(f.read())
+
+
+def best_pairs(digits):
+    rows, width = digits.shape
+    if width < 2:
+        return np.full(rows, -1, dtype=np.int64)
+
+    suffix_max = np.maximum.accumulate(digits[:, ::-1], axis=1)[:, ::-1]
+    pairs = digits[:, :-1].astype(np.int64) * 10 + suffix_max[:, 1:]
+    return pairs.max(axis=1)
+
+
+def select_digits(digits, keep=12):
+    rows, width = digits.shape
+    keep = min(keep, width)
+
+    selected = np.empty((rows, keep), dtype=np.uint8)
+    start = np.zeros(rows, dtype=np.int64)
+    columns = np.arange(width)
+    row_ids = np.arange(rows)
+
+    # Converted and allocated once; each pass only writes into the first last + 1 columns,
+    # since nothing past the window end can be picked anyway
+    signed = digits.astype(np.int8)
+    before = np.empty((rows, width), dtype=bool)
+    window = np.empty((rows, width), dtype=np.int8)
+
+    for t in range(keep):
+        last = width - keep + t
+        mask, masked = before[:, :last + 1], window[:, :last + 1]
+        np.less(columns[:last + 1], start[:, None], out=mask)
+        np.copyto(masked, signed[:, :last + 1])
+        np.copyto(masked, -1, where=mask)
+        picks = masked.argmax(axis=1)
+        selected[:, t] = digits[row_ids, picks]
+        start = picks + 1
+
+    return selected
+
+
+def as_numbers(selected):
+    keep = selected.shape[1]
+    if keep > 18:
+        # Too big for int64, let Python build the numbers
+        return [int("".join(map(str, row))) for row in selected.tolist()]
+
+    powers = 10 ** np.arange(keep - 1, -1, -1, dtype=np.int64)
+    return (selected.astype(np.int64) @ powers).tolist()
+
+
+# For big keep values the per-line numbers get huge, and building each one with int("".join(...))
+# and adding them up as Python big ints is where all the time goes. We never need the individual
+# numbers though, only the total: adding the picked digits column by column gives the total as
+# sum(column[j] * 10^(keep - 1 - j)), and one carry pass at the very end turns those column sums
+# into decimal digits. The same column sums also give the total modulo any number directly.
+# select_digits makes keep passes over the whole matrix, which only pays off for small keep, so
+# big_total streams the file one line at a time through the stack instead. That also means the
+# lines don't have to be the same length: a line shorter than keep is added right-aligned, whole.
+def joltage_digits(s, keep=12):
+    # Same stack as part2.max_joltage, but on bytes, returning the picked digits as uint8
+    remove = len(s) - keep
+    stack = bytearray()
+
+    for ch in s.encode("ascii"):
+        while stack and remove > 0 and stack[-1] < ch:
+            stack.pop()
+            remove -= 1
+        stack.append(ch)
+
+    return np.frombuffer(bytes(stack[:keep]), dtype=np.uint8) - ord("0")
+
+
+class DigitTotal:
+    def __init__(self, keep=12):
+        self.keep = keep
+        self.columns = np.zeros(keep, dtype=np.int64)
+
+    def add(self, selected):
+        # selected: one row of digits or a (rows x k) matrix, right-aligned if k < keep
+        selected = np.atleast_2d(selected)
+        width = selected.shape[1]
+        if width > self.keep:
+            raise ValueError(f"rows have {width} digits, more than keep={self.keep}")
+        self.columns[self.keep - width:] += selected.sum(axis=0, dtype=np.int64)
+
+    def decimal(self):
+        out = []
+        carry = 0
+        for column in reversed(self.columns.tolist()):
+            carry += column
+            out.append(carry % 10)
+            carry //= 10
+        while carry:
+            out.append(carry % 10)
+            carry //= 10
+
+        text = "".join(map(str, reversed(out))).lstrip("0")
+        return text or "0"
+
+    def mod(self, modulus):
+        result = 0
+        for column in self.columns.tolist():
+            result = (result * 10 + column) % modulus
+        return result
+
+
+def part1_total(file_path):
+    return int(best_pairs(load_matrix(file_path)).sum())
+
+
+def part2_total(file_path, keep=12):
+    return sum(as_numbers(select_digits(load_matrix(file_path), keep)))
+
+
+def big_total(file_path, keep, modulus=None):
+    total = DigitTotal(keep)
+    with open(file_path, "r") as f:
+        for line in f:
+            s = line.strip()
+            if s:
+                total.add(joltage_digits(s, keep))
+    return total.decimal() if modulus is None else total.mod(modulus)
+
+
+if __name__ == "__main__":
+    print(part1_total("input.txt"))
+    print(part2_total("input.txt"))
@@ -0,0 +1,41 @@
+# Index mode for small keep values on very long lines.
+# max_joltage pushes every character through the stack even when keep is tiny. Instead we record
+# once, for each digit 0-9, the sorted positions where it occurs. Each output digit is then the
+# biggest digit that has an occurrence inside the allowed window [start, len - keep + t], and
+# bisect finds the first occurrence at or after start. That is O(keep * 10 * log n) per query,
+# so asking for many different keep values on the same huge line is cheap after indexing.
+
+from bisect import bisect_left
+
+import numpy as np
+
+
+class DigitIndex:
+    def __init__(self, s):
+        self.length = len(s)
+        buf = np.frombuffer(s.encode("ascii"), dtype=np.uint8)
+        self.positions = [np.flatnonzero(buf == ord("0") + d).tolist() for d in range(10)]
+
+    def max_joltage(self, keep=12):
+        keep = min(keep, self.length)
+        value = 0
+        start = 0
+
+        for last in range(self.length - keep, self.length):
+            for d in range(9, -1, -1):
+                pos = self.positions[d]
+                i = bisect_left(pos, start)
+                if i < len(pos) and pos[i] <= last:
+                    value = value * 10 + d
+                    start = pos[i] + 1
+                    break
+
+        return value
+
+
+if __name__ == "__main__":
+    total = 0
+    with open("input.txt") as f:
+        for line in f:
+            total += DigitIndex(line.strip()).max_joltage(12)
+    print(total)
@@ -0,0 +1,127 @@
+# Best joltage for EVERY keep value k = 1..len(s) of a line, instead of one k at a time.
+# Calling max_joltage(s, k) for every k redoes the whole stack pass each time.
+#
+# The greedy for a given k picks output digit t as the leftmost biggest digit in the window
+# [previous pick + 1, len(s) - k + t]. That is a range-max query, and a sparse table answers
+# those in O(1) after an O(n log n) build: level j stores, for each i, the position of the
+# leftmost max of s[i : i + 2^j], and any window is covered by two overlapping blocks of one level.
+# So one table serves every k, and each k costs O(k) lookups.
+#
+# Both halves run in NumPy. The table is built one level at a time from two shifted views of the
+# previous level, and stored as one (levels x n) array. The lookups run in lockstep over k: step t
+# picks output digit t for every k > t at once, the same way bank_matrix.py does all rows at once.
+# Nothing is kept per k except its value so far: every step adds one digit to an int64
+# accumulator for each open k, and every CHUNK steps those accumulators are folded into the Python
+# ints (value * 10^CHUNK + chunk). A k that finishes mid-chunk folds in its partial chunk. So the
+# values are never parsed from decimal strings, and lines longer than Python's 4300-digit
+# str -> int limit work too.
+
+import numpy as np
+
+from bank_matrix import DigitTotal, joltage_digits
+
+# Digits per int64 accumulator before it is folded into the Python ints
+CHUNK = 18
+CHUNK_SHIFT = 10 ** CHUNK
+
+
+def build_sparse_table(digits):
+    n = len(digits)
+    levels = [np.arange(n)]
+    span = 1
+
+    while 2 * span <= n:
+        prev = levels[-1]
+        a, b = prev[:n - 2 * span + 1], prev[span:]
+        levels.append(np.where(digits[b] > digits[a], b, a))
+        span *= 2
+
+    # Pad the shorter levels so one fancy index can read any level; the padding is never read
+    table = np.zeros((len(levels), n), dtype=np.intp)
+    for j, level in enumerate(levels):
+        table[j, :len(level)] = level
+    return table
+
+
+def range_max(table, digits, lo, hi):
+    # Position of the leftmost biggest digit in digits[lo..hi] (inclusive), elementwise
+    j = np.frexp(hi - lo + 1)[1] - 1
+    a, b = table[j, lo], table[j, hi - (1 << j) + 1]
+    return np.where(digits[b] > digits[a], b, a)
+
+
+def joltage_profile(s):
+    digits = np.frombuffer(s.encode("ascii"), dtype=np.uint8) - ord("0")
+    n = len(digits)
+    table = build_sparse_table(digits)
+
+    values = [0] * n
+    acc = np.zeros(n, dtype=np.int64)
+    start = np.zeros(n, dtype=np.intp)
+    keeps = np.arange(1, n + 1)
+
+    for t in range(n):
+        # Only keep values k > t have an output digit t; values[k - 1] and acc[k - 1] belong to k
+        last = n - keeps[t:] + t
+        picks = range_max(table, digits, start[t:], last)
+        acc[t:] = acc[t:] * 10 + digits[picks]
+        start[t:] = picks + 1
+
+        filled = t % CHUNK + 1
+        if filled == CHUNK:
+            for i, chunk in enumerate(acc[t:].tolist(), t):
+                values[i] = values[i] * CHUNK_SHIFT + chunk
+            acc[t:] = 0
+        else:
+            # k = t + 1 took its last digit this step
+            values[t] = values[t] * 10 ** filled + int(acc[t])
+
+    return values
+
+
+def verify(s, keeps=None, modulus=(1 << 61) - 1):
+    # Checks the profile against the bank_matrix stack for the given k (default: a spread of k
+    # up to len(s)). Compared modulo a prime, since the values can be too long to print.
+    profile = joltage_profile(s)
+    n = len(s)
+    keeps = keeps or sorted({1, 2, 12, n // 3, n // 2, n - 1, n} - {0})
+
+    for k in keeps:
+        total = DigitTotal(k)
+        total.add(joltage_digits(s, k))
+        if profile[k - 1] % modulus != total.mod(modulus):
+            raise AssertionError(f"k={k}: profile and stack disagree on a {n}-digit line")
+    return True
+
+
+def file_profile(file_path):
+    # totals[k - 1] = sum over all lines of the best k-digit joltage.
+    # Like max_joltage, a line shorter than k just contributes its whole value.
+    totals = []
+    whole_sum = 0
+
+    with open(file_path, "r") as f:
+        for line in f:
+            s = line.strip()
+            if not s:
+                continue
+
+            profile = joltage_profile(s)
+            if len(profile) > len(totals):
+                totals.extend([whole_sum] * (len(profile) - len(totals)))
+
+            for k in range(len(totals)):
+                totals[k] += profile[min(k, len(profile) - 1)]
+            whole_sum += profile[-1]
+
+    return totals
+
+
+if __name__ == "__main__":
+    # Regression check: a line past Python's 4300-digit str -> int limit must still work
+    rng = np.random.default_rng(0)
+    verify("".join(map(str, rng.integers(0, 10, 5000).tolist())))
+
+    totals = file_profile("input.txt")
+    print(totals[1])
+    print(totals[11])
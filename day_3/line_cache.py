@@ -0,0 +1,97 @@
+# On-disk cache of per-line day 3 answers.
+# Our inputs are regenerated nightly but most bank lines stay the same, so we remember the answer
+# for each (line hash, part, keep) in a small SQLite file and only compute lines we haven't seen.
+# Every lookup stamps the entry with a counter; when the cache grows past max_entries the least
+# recently used entries are dropped. hits / misses are counted so report() can show how much
+# work the cache saved.
+# The file lives next to this module, so every script shares one cache whatever directory it runs
+# from. Every commit_every new answers we evict and commit, so the size cap holds during a long
+# run and a crash only loses the answers since the last commit.
+
+import hashlib
+import os
+import sqlite3
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "line_cache.sqlite")
+DEFAULT_MAX_ENTRIES = 1_000_000
+DEFAULT_COMMIT_EVERY = 1000
+
+
+class LineCache:
+    def __init__(self, path=DEFAULT_PATH, max_entries=DEFAULT_MAX_ENTRIES, commit_every=DEFAULT_COMMIT_EVERY):
+        self.max_entries = max_entries
+        self.commit_every = commit_every
+        self.pending = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self.clock = self.conn.execute("SELECT COALESCE(MAX(used), 0) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def key(line, part, keep):
+        digest = hashlib.blake2b(line.encode("ascii"), digest_size=16).hexdigest()
+        return f"{digest}:{part}:{keep}"
+
+    def _tick(self):
+        self.clock += 1
+        return self.clock
+
+    def get(self, line, part, keep):
+        key = self.key(line, part, keep)
+        row = self.conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.conn.execute("UPDATE results SET used = ? WHERE key = ?", (self._tick(), key))
+        return int(row[0])
+
+    def put(self, line, part, keep, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, ?)",
+            (self.key(line, part, keep), str(value), self._tick()),
+        )
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.flush()
+
+    def get_or_compute(self, line, part, keep, compute):
+        value = self.get(line, part, keep)
+        if value is None:
+            value = compute(line)
+            self.put(line, part, keep, value)
+        return value
+
+    def evict(self):
+        count = self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def flush(self):
+        self.evict()
+        self.conn.commit()
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def report(self):
+        lookups = self.hits + self.misses
+        rate = 100 * self.hits / lookups if lookups else 0
+        return f"cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate)"
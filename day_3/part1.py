@@ -16,12 +16,18 @@ def highest_two_digit_number(s):
 
     return best
 
-total_sum = 0
+if __name__ == "__main__":
+    import sys
+    from line_cache import LineCache
 
-with open("input.txt", "r") as f:
-    for line in f:
-        s = line.strip()
-        total_sum += highest_two_digit_number(s)
+    total_sum = 0
 
-print(total_sum)
+    # Lines we've already seen in an earlier run come straight from the cache
+    with LineCache() as cache, open("input.txt", "r") as f:
+        for line in f:
+            s = line.strip()
+            total_sum += cache.get_or_compute(s, 1, 2, highest_two_digit_number)
+
+    print(total_sum)
+    print(cache.report(), file=sys.stderr)
 
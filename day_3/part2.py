@@ -10,12 +10,18 @@ def max_joltage(s, keep=12):
 
     return int("".join(stack[:keep]))
 
-total = 0
+if __name__ == "__main__":
+    import sys
+    from line_cache import LineCache
 
-with open("input.txt") as f:
-    for line in f:
-        s = line.strip()
-        total += max_joltage(s)
+    total = 0
 
-print(total)
+    # Lines we've already seen in an earlier run come straight from the cache
+    with LineCache() as cache, open("input.txt") as f:
+        for line in f:
+            s = line.strip()
+            total += cache.get_or_compute(s, 2, 12, max_joltage)
+
+    print(total)
+    print(cache.report(), file=sys.stderr)
 
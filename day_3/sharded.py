@@ -0,0 +1,95 @@
+# Streaming, multi-core day 3 for bank dumps far bigger than memory.
+# The file is cut into one shard per work unit at newline boundaries. Each worker memory-maps
+# the file and walks its shard in chunks of about CHUNK_BYTES (again cut at newlines), solving
+# each chunk with the NumPy engine in bank_matrix.py, so memory stays constant whatever the
+# file size. Chunks with ragged lines fall back to the per-line functions.
+# Workers return (part 1 sum, part 2 sum) and we add them up in shard order.
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from bank_matrix import matrix_from_bytes, best_pairs, select_digits, as_numbers
+from part1 import highest_two_digit_number
+from part2 import max_joltage
+
+CHUNK_BYTES = 8 << 20
+
+
+def shard_bounds(file_path, shards):
+    size = os.path.getsize(file_path)
+    bounds = [0]
+
+    with open(file_path, "rb") as f:
+        for i in range(1, shards):
+            f.seek(max(size * i // shards, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def solve_chunk(raw, keep):
+    try:
+        digits = matrix_from_bytes(raw)
+    except ValueError:
+        # Ragged lines: do them one at a time
+        lines = [line.decode("ascii") for line in raw.split()]
+        return (sum(highest_two_digit_number(s) for s in lines),
+                sum(max_joltage(s, keep) for s in lines))
+
+    if digits.size == 0:
+        return 0, 0
+    return int(best_pairs(digits).sum()), sum(as_numbers(select_digits(digits, keep)))
+
+
+def solve_shard(file_path, begin, end, keep=12, chunk_bytes=CHUNK_BYTES):
+    part1 = part2 = 0
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = begin
+        while pos < end:
+            stop = min(pos + chunk_bytes, end)
+            if stop < end:
+                cut = mm.rfind(b"\n", pos, stop)
+                if cut == -1:
+                    # One line longer than a chunk: take the whole line
+                    cut = mm.find(b"\n", stop, end)
+                stop = end if cut == -1 else cut + 1
+
+            p1, p2 = solve_chunk(mm[pos:stop], keep)
+            part1 += p1
+            part2 += p2
+            pos = stop
+
+    return part1, part2
+
+
+def solve(file_path, workers=None, keep=12):
+    if os.path.getsize(file_path) == 0:
+        return 0, 0
+
+    workers = workers or os.cpu_count() or 1
+    shards = shard_bounds(file_path, workers * 4)
+
+    part1 = part2 = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            solve_shard,
+            [file_path] * len(shards),
+            [a for a, _ in shards],
+            [b for _, b in shards],
+            [keep] * len(shards),
+        )
+        for p1, p2 in results:
+            part1 += p1
+            part2 += p2
+
+    return part1, part2
+
+
+if __name__ == "__main__":
+    part1_total, part2_total = solve("input.txt")
+    print(part1_total)
+    print(part2_total)
@@ -1,4 +1,5 @@
 import sys
+from array import array
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QLineEdit, QTextEdit, QSlider, QMessageBox
@@ -6,6 +7,83 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
+KEEP = 12
+
+
+class Trace:
+    # The whole run recorded up front, one entry per timeline step (the state AFTER t steps):
+    #   line[t], pos[t]       which line / character the algorithm is looking at
+    #   a[t], b[t]            part 1: max_right, best   part 2: index of the stack top, removed count
+    # For part 2, below[offset[line] + i] is the index that was under character i when it was
+    # pushed, so the stack at any step is rebuilt by walking down from the top.
+    # results[i] is line i's answer and totals[i] the sum of the first i answers.
+    def __init__(self):
+        self.line = array("i")
+        self.pos = array("i")
+        self.a = array("i")
+        self.b = array("i")
+        self.below = array("i")
+        self.offset = array("q")
+        self.results = array("q")
+        self.totals = array("q", [0])
+
+    def __len__(self):
+        return len(self.line)
+
+    def record(self, line, pos, a, b):
+        self.line.append(line)
+        self.pos.append(pos)
+        self.a.append(a)
+        self.b.append(b)
+
+    def stack(self, t, s):
+        chars = []
+        i = self.a[t]
+        base = self.offset[self.line[t]]
+        while i >= 0:
+            chars.append(s[i])
+            i = self.below[base + i]
+        return chars[::-1]
+
+
+def record_trace(lines, part):
+    # Same steps as the old one-character-per-tick code, just run all at once
+    trace = Trace()
+
+    for line_idx, s in enumerate(lines):
+        trace.offset.append(len(trace.below))
+
+        if part == 1:
+            max_right = best = -1
+            for pos in range(len(s) - 1, -1, -1):
+                trace.record(line_idx, pos, max_right, best)
+                d = int(s[pos])
+                if max_right != -1:
+                    best = max(best, d * 10 + max_right)
+                max_right = max(max_right, d)
+            trace.record(line_idx, -1, max_right, best)
+            result = best
+        else:
+            top, removed, to_remove = -1, 0, len(s) - KEEP
+            for pos, ch in enumerate(s):
+                trace.record(line_idx, pos, top, removed)
+                while top >= 0 and removed < to_remove and s[top] < ch:
+                    top = trace.below[trace.offset[line_idx] + top]
+                    removed += 1
+                trace.below.append(top)
+                top = pos
+            trace.record(line_idx, len(s), top, removed)
+            result_str = "".join(trace.stack(len(trace) - 1, s)[:KEEP])
+            result = int(result_str) if result_str else 0
+
+        trace.results.append(result)
+        trace.totals.append(trace.totals[-1] + result)
+
+    trace.offset.append(len(trace.below))
+    trace.record(len(lines), 0, -1, -1)
+    return trace
+
+
 class Day3Visualizer(QWidget):
     def __init__(self):
         super().__init__()
@@ -16,7 +94,6 @@ class Day3Visualizer(QWidget):
         self.current_part = 1
         self.lines = []
         self.current_line_idx = 0
-        self.current_step = 0
         self.is_playing = False
         self.speed = 500
 
@@ -31,9 +108,15 @@ class Day3Visualizer(QWidget):
         self.remove_count = 0
         self.total_to_remove = 0
 
-        self.line_results = []
+        # Lines finished so far; their results are read straight from the trace
+        self.finished_lines = 0
         self.total_sum = 0
 
+        # Recorded run + where we are on its timeline
+        self.trace = None
+        self.step = 0
+        self.shown_results = 0
+
         # Timer
         self.timer = QTimer()
         self.timer.timeout.connect(self._tick)
@@ -107,6 +190,12 @@ class Day3Visualizer(QWidget):
         self.line_label = QLabel("Line: -")
         main.addWidget(self.line_label)
 
+        # Timeline: jump to any step of the recorded run
+        self.timeline = QSlider(Qt.Orientation.Horizontal)
+        self.timeline.setRange(0, 0)
+        self.timeline.valueChanged.connect(self.seek)
+        main.addWidget(self.timeline)
+
         # Visualization area
         self.visual_box = QTextEdit()
         self.visual_box.setReadOnly(True)
@@ -166,92 +255,55 @@ class Day3Visualizer(QWidget):
             return
 
         self.lines = [line.strip() for line in text.split('\n') if line.strip()]
-        self.current_line_idx = 0
-        self.current_step = 0
-        self.line_results = []
-        self.total_sum = 0
-        
-        if self.lines:
-            self._start_new_line()
-        
+        self.trace = record_trace(self.lines, self.current_part)
+
+        self.results_list.clear()
+        self.shown_results = 0
+        self.timeline.blockSignals(True)
+        self.timeline.setRange(0, len(self.trace) - 1)
+        self.timeline.blockSignals(False)
+
+        self.seek(0)
+
+    def seek(self, step):
+        if self.trace is None:
+            return
+
+        self.step = step
+        self._restore(step)
+        self.timeline.blockSignals(True)
+        self.timeline.setValue(step)
+        self.timeline.blockSignals(False)
         self._update_ui()
 
-    def _start_new_line(self):
+    def _restore(self, t):
+        trace = self.trace
+        self.current_line_idx = trace.line[t]
+        self.finished_lines = self.current_line_idx
+        self.total_sum = trace.totals[self.current_line_idx]
+
         if self.current_line_idx >= len(self.lines):
+            self.is_playing = False
+            self.timer.stop()
+            self.play_btn.setText("▶ Play")
             return
 
         self.current_string = self.lines[self.current_line_idx]
-        
+        self.current_pos = trace.pos[t]
+
         if self.current_part == 1:
-            # Part 1: Start from the end
-            self.current_pos = len(self.current_string) - 1
-            self.max_right = -1
-            self.best = -1
+            self.max_right = trace.a[t]
+            self.best = trace.b[t]
         else:
-            # Part 2: Start from the beginning
-            self.current_pos = 0
-            self.stack = []
-            self.total_to_remove = len(self.current_string) - 12
-            self.remove_count = 0
+            self.stack = trace.stack(t, self.current_string)
+            self.remove_count = trace.b[t]
+            self.total_to_remove = len(self.current_string) - KEEP
 
     def step_forward(self):
         if not self.lines or self.current_line_idx >= len(self.lines):
             return
 
-        if self.current_part == 1:
-            self._step_part1()
-        else:
-            self._step_part2()
-        
-        self._update_ui()
-
-    def _step_part1(self):
-        if self.current_pos < 0:
-            # Finished current line, move to next
-            self.line_results.append(self.best)
-            self.total_sum += self.best
-            self.current_line_idx += 1
-            
-            if self.current_line_idx < len(self.lines):
-                self._start_new_line()
-            else:
-                self.is_playing = False
-                self.timer.stop()
-            return
-
-        d = int(self.current_string[self.current_pos])
-        
-        if self.max_right != -1:
-            self.best = max(self.best, d * 10 + self.max_right)
-        
-        self.max_right = max(self.max_right, d)
-        self.current_pos -= 1
-
-    def _step_part2(self):
-        if self.current_pos >= len(self.current_string):
-            # Finished processing, extract result
-            result_str = "".join(self.stack[:12])
-            result = int(result_str) if result_str else 0
-            self.line_results.append(result)
-            self.total_sum += result
-            self.current_line_idx += 1
-            
-            if self.current_line_idx < len(self.lines):
-                self._start_new_line()
-            else:
-                self.is_playing = False
-                self.timer.stop()
-            return
-
-        ch = self.current_string[self.current_pos]
-        
-        # Remove smaller digits from stack if we can
-        while self.stack and self.remove_count < self.total_to_remove and self.stack[-1] < ch:
-            self.stack.pop()
-            self.remove_count += 1
-        
-        self.stack.append(ch)
-        self.current_pos += 1
+        self.seek(self.step + 1)
 
     def toggle_play(self):
         if not self.lines:
@@ -267,20 +319,23 @@ class Day3Visualizer(QWidget):
             self.timer.stop()
 
     def _tick(self):
+        # Reaching the end stops the timer and resets the Play button in _restore
         self.step_forward()
-        if self.current_line_idx >= len(self.lines):
-            self.is_playing = False
-            self.timer.stop()
-            self.play_btn.setText("▶ Play")
 
     def reset(self):
         self.timer.stop()
         self.is_playing = False
         self.lines = []
         self.current_line_idx = 0
-        self.current_step = 0
-        self.line_results = []
+        self.finished_lines = 0
         self.total_sum = 0
+        self.trace = None
+        self.step = 0
+        self.shown_results = 0
+        self.results_list.clear()
+        self.timeline.blockSignals(True)
+        self.timeline.setRange(0, 0)
+        self.timeline.blockSignals(False)
         self.play_btn.setText("▶ Play")
         self._update_ui()
 
@@ -308,7 +363,7 @@ class Day3Visualizer(QWidget):
         if self.current_part == 1 and self.best >= 0:
             self.current_result_label.setText(str(self.best))
         elif self.current_part == 2 and self.stack:
-            result_str = "".join(self.stack[:12])
+            result_str = "".join(self.stack[:KEEP])
             self.current_result_label.setText(result_str if result_str else "-")
         else:
             self.current_result_label.setText("-")
@@ -316,9 +371,15 @@ class Day3Visualizer(QWidget):
         # Update total
         self.total_label.setText(str(self.total_sum))
 
-        # Update results list
-        results_text = "\n".join(f"Line {i+1}: {r}" for i, r in enumerate(self.line_results))
-        self.results_list.setPlainText(results_text)
+        # Update results list: only append lines finished since last time,
+        # rebuild only when the timeline moved backwards
+        done = self.finished_lines
+        if done < self.shown_results:
+            self.results_list.clear()
+            self.shown_results = 0
+        for i in range(self.shown_results, done):
+            self.results_list.append(f"Line {i+1}: {self.trace.results[i]}")
+        self.shown_results = done
 
         # Enable/disable buttons
         has_lines = bool(self.lines)
@@ -371,7 +432,7 @@ class Day3Visualizer(QWidget):
                 viz.append(f"Stack size: {len(self.stack)}")
             else:
                 viz.append("✓ Completed!")
-                result = "".join(self.stack[:12])
+                result = "".join(self.stack[:KEEP])
                 viz.append(f"Final stack: {''.join(self.stack)}")
                 viz.append(f"Result (first 12): {result}")
 
@@ -0,0 +1,41 @@
+# NumPy version of day 4 part 1.
+# Turn the map into a 0/1 uint8 array with a border of zeros around it. Then the number of '@'
+# neighbours of every cell is the sum of the eight views of the padded array shifted by one
+# in each direction, and no bounds checks are needed. A roll is accessible if it has fewer
+# than 4 neighbours, which is a single boolean reduction over the whole grid.
+
+import numpy as np
+
+
+def grid_from_str(grid_str):
+    lines = grid_str.strip().splitlines()
+    if any(len(line) != len(lines[0]) for line in lines):
+        raise ValueError("all rows must have the same length")
+    raw = "".join(lines).encode("ascii")
+    return (np.frombuffer(raw, dtype=np.uint8) == ord("@")).astype(np.uint8).reshape(len(lines), -1)
+
+
+def neighbor_counts(grid):
+    rows, cols = grid.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid
+
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[dr:dr + rows, dc:dc + cols]
+    return counts
+
+
+def solve(grid_str: str) -> int:
+    grid = grid_from_str(grid_str)
+    return int(np.count_nonzero(grid & (neighbor_counts(grid) < 4)))
+
+
+if __name__ == "__main__":
+    with open("input.txt", "r") as f:
+        grid_input = f.read()
+
+    print(solve(grid_input))
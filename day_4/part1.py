@@ -27,9 +27,10 @@ def solve(grid_str: str) -> int:
 
     return accessible
 
-# Read input from file and solve
-with open("input.txt", "r") as f:
-    grid_input = f.read()
+if __name__ == "__main__":
+    # Read input from file and solve
+    with open("input.txt", "r") as f:
+        grid_input = f.read()
 
-print(solve(grid_input))
+    print(solve(grid_input))
 